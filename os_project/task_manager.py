@@ -22,11 +22,61 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import time
+import traceback
+import concurrent.futures
+from collections import defaultdict, deque
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from win10toast_click import ToastNotifier
 
+try:
+    import orjson  # optional: faster (de)serialization of the suspend state
+except ImportError:
+    orjson = None
+
 SUSPEND_STATE_FILE = "suspended_state.json"
+DISPLAY_CHUNK_SIZE = 50  # tree rows updated per idle callback
+# fixed STOP durations offered in the combobox, in seconds
+STOP_DURATION_SECONDS = {
+    "2 Hours": 2 * 3600,
+    "7 Days": 7 * 24 * 3600,
+    "1 Month": 30 * 24 * 3600,
+    "1 Year": 365 * 24 * 3600,
+}
+CUSTOM_STOP_CHOICE = "Custom (Minutes)"
+MAX_AFTER_MS = 24 * 3600 * 1000  # longest single Tk timer used for resume scheduling
+# shown by _do_resume; "{}" is replaced with the number of processes resumed
+AUTO_RESUME_MESSAGE = "{} process(es) resumed automatically."
+PERSISTED_RESUME_MESSAGE = "{} process(es) resumed (persisted session)."
+ADAPT_IDLE_DELTA = 2.0  # % change below which polling backs off
+ADAPT_BUSY_DELTA = 10.0  # % change above which polling returns to its fastest rate
+GRAPH_SAMPLES = 60  # points kept in the live graph
+DEFAULT_MAX_ROWS = 50  # groups shown individually before the rest fold into "Other"
+OTHER_GROUP_KEY = "__other__"
+NET_SAMPLE_MIN_CPU = 0.1  # % CPU above which a known process's I/O counters are re-read
+
+
+def _new_group():
+    """Empty aggregate for one process group; filled in by _refresh_processes."""
+    return {
+        "key": None,
+        "display_name": None,
+        "pids": [],
+        "cpu": 0.0,
+        "memory": 0.0,
+        "power": 0.0,
+        "network": 0.0,
+        # per-PID stats as parallel lists, index-aligned with "pids"
+        "per_pid_cpu": [],
+        "per_pid_memory": [],
+        "per_pid_power": [],
+        "per_pid_network": [],
+        "display_name_lc": "",
+        "pid_strs": (),
+        "is_other": False
+    }
+
+
 class TaskManagerApp:
     def __init__(self, root):
         self.root = root
@@ -34,13 +84,35 @@ class TaskManagerApp:
 
         # --- State / constants ---
         self.CPU_TDP_WATTS = 15.0
-        self.update_interval = 30000  # ms
+        self.update_interval = 30000  # ms, adapts between _refresh_min and _refresh_max
+        self._refresh_min = 30000
+        self._refresh_max = 120000
+        self._last_cpu_total = None
+        self._cpu_count = psutil.cpu_count() or 1
+        self._graph_interval_ms = 1000  # adapts between _graph_min and _graph_max
+        self._graph_min = 500
+        self._graph_max = 5000
+        self._last_graph_sample = None  # (cpu, mem)
         self.refreshing = False
+        self._refresh_after_id = None  # pending auto-refresh timer
         self.all_processes = []  # aggregated list
         self.last_net_io = {}  # pid -> (bytes, timestamp)
-        self.notifier = ToastNotifier()
+        self._io_denied = set()  # pids whose io_counters raised AccessDenied
+        self._name_cache = {}  # pid -> (key, display_name, raw name)
+        self._row_index = {}  # group key -> parent iid
+        self._child_index = {}  # (group key, pid) -> child iid
+        self._row_cache = {}  # iid -> last (text, values, tags) / values written to Tk
+        self._top_order = []  # parent iids in tree order, mirrored to avoid no-op moves
+        self._name_to_iid = {}  # lowercased display name -> parent iid
+        self._pids_by_iid = {}  # parent iid -> list of int pids in that group
+        self._display_generation = 0  # bumped on every render to cancel stale chunks
+        self.notifier = None  # created lazily by _get_notifier
         self.alerted_names = set()
         self.notification_lock = threading.Lock()
+        # one long-lived worker is reused for every refresh instead of a new thread each time
+        self._refresh_future = None  # last submitted refresh
+        self._closing = False  # set by on_close; the refresh worker stops touching Tk
+        self._refresh_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="tm-refresh")
 
         # Keep track of active suspended sessions in memory
         # (also persisted to file)
@@ -59,6 +131,11 @@ class TaskManagerApp:
         self.memory_limit_entry.insert(0, "200")
         self.memory_limit_entry.pack(side=tk.LEFT, padx=4)
 
+        tk.Label(input_frame, text="Max Rows:").pack(side=tk.LEFT, padx=6)
+        self.max_rows_entry = tk.Entry(input_frame, width=6)
+        self.max_rows_entry.insert(0, str(DEFAULT_MAX_ROWS))
+        self.max_rows_entry.pack(side=tk.LEFT, padx=4)
+
         tk.Button(input_frame, text="Search", command=self.search_process).pack(side=tk.LEFT, padx=4)
         tk.Button(input_frame, text="Refresh", command=self.manual_refresh).pack(side=tk.LEFT, padx=4)
         tk.Button(input_frame, text="End Task", command=self.end_selected_task).pack(side=tk.LEFT, padx=4)
@@ -68,7 +145,7 @@ class TaskManagerApp:
 
         self.stop_duration = ttk.Combobox(
             input_frame,
-            values=["2 Hours", "7 Days", "1 Month", "1 Year", "Custom (Minutes)"],
+            values=list(STOP_DURATION_SECONDS) + [CUSTOM_STOP_CHOICE],
             width=18,
             state="readonly"
         )
@@ -114,13 +191,19 @@ class TaskManagerApp:
         self.ax.set_xlabel("Samples")
         self.ax.set_ylabel("Usage (%)")
 
-        self.cpu_data, self.mem_data = [], []
-        self.line_cpu, = self.ax.plot([], [], label="CPU", lw=2)
-        self.line_mem, = self.ax.plot([], [], label="Memory", lw=2)
-        self.ax.legend(loc="upper right")
+        self.cpu_data = deque(maxlen=GRAPH_SAMPLES)
+        self.mem_data = deque(maxlen=GRAPH_SAMPLES)
+        # lines are animated so they stay out of the cached background and can be blitted
+        self.line_cpu, = self.ax.plot([], [], label="CPU", lw=2, animated=True)
+        self.line_mem, = self.ax.plot([], [], label="Memory", lw=2, animated=True)
+        self.legend = self.ax.legend(loc="upper right")
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._graph_bg = None
+        self._graph_xmax = None
+        # every full draw (startup, resize, axis change) refreshes the cached background
+        self.canvas.mpl_connect("draw_event", self._on_graph_draw)
 
         # Prime and start
         self._prime_cpu_percent()
@@ -131,6 +214,15 @@ class TaskManagerApp:
         # schedule small delay so window shows first
         self.root.after(500, self.check_persisted_suspend_state)
 
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        """Stop the refresh worker and close the window."""
+        # the pool's worker is joined at exit; this keeps it off the destroyed root
+        self._closing = True
+        self._refresh_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     # ---------------- Persistence helpers ----------------
     def save_suspend_state(self, pid_list, resume_time):
         """Save suspended session to disk so it persists across app restarts."""
@@ -140,20 +232,34 @@ class TaskManagerApp:
                 "resume_time": float(resume_time),
                 "saved_at": time.time()
             }
-            with open(SUSPEND_STATE_FILE, "w") as f:
-                json.dump(data, f)
+            # write to a temp file, flush it to disk, then rename over the target
+            # so a crash mid-write never leaves a truncated or empty state file
+            tmp = SUSPEND_STATE_FILE + ".tmp"
+            with open(tmp, "wb") as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(data))
+                else:
+                    f.write(json.dumps(data).encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, SUSPEND_STATE_FILE)
             # keep in-memory copy too
             self.active_suspended = data
         except Exception:
-            pass
+            # don't leave a partial temp file behind
+            try:
+                os.remove(SUSPEND_STATE_FILE + ".tmp")
+            except OSError:
+                pass
 
     def load_suspend_state(self):
         """Load suspended session from disk (if present). Returns dict or None."""
         try:
             if not os.path.exists(SUSPEND_STATE_FILE):
                 return None
-            with open(SUSPEND_STATE_FILE, "r") as f:
-                data = json.load(f)
+            with open(SUSPEND_STATE_FILE, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             # Basic validation
             if not isinstance(data.get("pids"), list) or "resume_time" not in data:
                 return None
@@ -181,49 +287,31 @@ class TaskManagerApp:
         # If child selected, get parent; else use selected
         parent = selected if not self.tree.parent(selected) else self.tree.parent(selected)
 
-        # Collect PIDs from child rows
-        pid_list = []
-        for child in self.tree.get_children(parent):
-            pid_val = str(self.tree.set(child, "pids") or "")
-            if pid_val.isdigit():
-                pid_list.append(int(pid_val))
-            else:
-                text = str(self.tree.item(child, "text") or "")
-                if text.lower().startswith("pid"):
-                    try:
-                        pid_list.append(int(text.split()[1]))
-                    except Exception:
-                        pass
+        pid_list = self._pids_by_iid.get(parent, [])
 
         if not pid_list:
             messagebox.showwarning("Warning", "Could not determine PIDs to stop.")
             return
 
         choice = self.stop_duration.get()
-        if choice == "2 Hours":
-            seconds = 2 * 3600
-        elif choice == "7 Days":
-            seconds = 7 * 24 * 3600
-        elif choice == "1 Month":
-            seconds = 30 * 24 * 3600
-        elif choice == "1 Year":
-            seconds = 365 * 24 * 3600
-        elif choice == "Custom (Minutes)":
-            try:
-                seconds = float(self.custom_minutes.get()) * 60
-            except Exception:
-                messagebox.showerror("Error", "Invalid custom minutes.")
-                return
-        else:
-            seconds = 3600
+        seconds = STOP_DURATION_SECONDS.get(choice)
+        if seconds is None:
+            if choice == CUSTOM_STOP_CHOICE:
+                try:
+                    seconds = float(self.custom_minutes.get()) * 60
+                except Exception:
+                    messagebox.showerror("Error", "Invalid custom minutes.")
+                    return
+            else:
+                seconds = 3600
 
         if not messagebox.askyesno("Confirm", f"Suspend {len(pid_list)} processes for {seconds/60:.1f} minutes?"):
             return
 
-        # Start background thread that suspends, persists state, waits, and resumes.
-        threading.Thread(target=self._suspend_resume_processes, args=(pid_list, seconds), daemon=True).start()
+        # Suspend on a short-lived worker; the resume itself is scheduled on the Tk loop.
+        threading.Thread(target=self._do_suspend, args=(pid_list, seconds), daemon=True).start()
 
-    def _suspend_resume_processes(self, pid_list, seconds):
+    def _do_suspend(self, pid_list, seconds):
         # compute resume epoch
         resume_time = time.time() + float(seconds)
         # persist state before suspending so we can resume on restart
@@ -232,12 +320,13 @@ class TaskManagerApp:
         except Exception:
             pass
 
-        suspended_pids = []
+        # keep the Process handles so resume reuses them instead of looking pids up again
+        suspended_procs = []
         for pid in pid_list:
             try:
                 p = psutil.Process(pid)
                 p.suspend()
-                suspended_pids.append(pid)
+                suspended_procs.append(p)
             except Exception:
                 # ignore errors (permission, process gone)
                 pass
@@ -245,23 +334,27 @@ class TaskManagerApp:
         # show initial stopped info on main thread
         self.root.after(0, lambda: messagebox.showinfo(
             "Stopped",
-            f"{len(suspended_pids)} process(es) suspended.\nThey will resume automatically after the selected duration, or when you choose to resume on app restart."
+            f"{len(suspended_procs)} process(es) suspended.\nThey will resume automatically after the selected duration, or when you choose to resume on app restart."
         ))
 
-        # Sleep (non-blocking UI because this is a background thread)
-        # If app closes while sleeping, resume won't occur here--it will be handled on startup via persisted file.
-        time_left = resume_time - time.time()
-        if time_left > 0:
-            time.sleep(time_left)
+        # No thread waits for the resume: the Tk event loop fires it.
+        # If the app closes first, the persisted file handles it on startup.
+        self.root.after(0, lambda: self._schedule_resume(
+            suspended_procs, resume_time, AUTO_RESUME_MESSAGE
+        ))
 
-        # Attempt to resume (if app still running)
-        resumed = 0
-        for pid in suspended_pids:
-            try:
-                psutil.Process(pid).resume()
-                resumed += 1
-            except Exception:
-                pass
+    def _schedule_resume(self, procs, resume_time, message):
+        """Arrange for _do_resume to run at resume_time. Must be called on the Tk thread.
+        Long waits are split into MAX_AFTER_MS steps since Tk timers are limited in range."""
+        remaining_ms = int((resume_time - time.time()) * 1000)
+        if remaining_ms <= 0:
+            self._do_resume(procs, message)
+        else:
+            self.root.after(min(remaining_ms, MAX_AFTER_MS), self._schedule_resume, procs, resume_time, message)
+
+    def _do_resume(self, procs, message):
+        """Resume procs, clear persisted state and report how many were resumed."""
+        resumed = self.resume_procs(procs)
 
         # clear persisted state and show resumed message
         try:
@@ -270,7 +363,7 @@ class TaskManagerApp:
             pass
 
         if resumed > 0:
-            self.root.after(0, lambda: messagebox.showinfo("Resumed", f"{resumed} process(es) resumed automatically."))
+            messagebox.showinfo("Resumed", message.format(resumed))
 
     def resume_pids(self, pid_list):
         """Resume a list of PIDs (best-effort)."""
@@ -283,7 +376,37 @@ class TaskManagerApp:
                 pass
         return resumed
 
+    def resume_procs(self, procs):
+        """Resume already-open psutil.Process handles (best-effort)."""
+        resumed = 0
+        for p in procs:
+            try:
+                p.resume()
+                resumed += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return resumed
+
+    def _procs_for_pids(self, pid_list):
+        """Open psutil.Process handles for pids that still exist."""
+        procs = []
+        for pid in pid_list:
+            try:
+                procs.append(psutil.Process(int(pid)))
+            except Exception:
+                pass
+        return procs
+
     # ---------------- CPU / network helpers ----------------
+    @staticmethod
+    def _adapt_interval(interval, delta, min_ms, max_ms):
+        """Grow the polling interval while `delta` stays small, reset it on activity."""
+        if delta < ADAPT_IDLE_DELTA:
+            return min(int(interval * 1.5), max_ms)
+        if delta > ADAPT_BUSY_DELTA:
+            return min_ms
+        return interval
+
     def _prime_cpu_percent(self):
         for p in psutil.process_iter(['pid']):
             try:
@@ -301,99 +424,163 @@ class TaskManagerApp:
         except Exception:
             return 0.0
 
-    def _get_network_kbps_for_pid(self, pid, proc, now):
-        try:
-            io = proc.io_counters()
-            total_bytes = (getattr(io, "read_bytes", 0) or 0) + (getattr(io, "write_bytes", 0) or 0)
-            if pid in self.last_net_io:
-                last_bytes, last_time = self.last_net_io[pid]
-                delta = total_bytes - last_bytes
-                dt = max(now - last_time, 0.001)
-                kbps = (delta / dt) / 1024.0
-            else:
-                kbps = 0.0
-            self.last_net_io[pid] = (total_bytes, now)
-            return max(kbps, 0.0)
-        except Exception:
-            return 0.0
-
     # ---------------- Refresh / grouping ----------------
     def manual_refresh(self):
-        if not self.refreshing:
-            threading.Thread(target=self.update_processes_list, daemon=True).start()
+        # `refreshing` is only set once the worker starts, so also skip while a
+        # submitted refresh is still queued
+        fut = self._refresh_future
+        if self._closing or self.refreshing or (fut is not None and not fut.done()):
+            return
+        self._refresh_future = self._refresh_pool.submit(self.update_processes_list)
+        self._refresh_future.add_done_callback(self._on_refresh_done)
+
+    def _on_refresh_done(self, fut):
+        """Print refresh errors that would otherwise stay hidden inside the Future."""
+        if fut.cancelled():
+            return
+        exc = fut.exception()
+        if exc is not None:
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+
+    def _schedule_next_refresh(self):
+        """(Re)arm the auto-refresh timer, cancelling any pending one so a manual
+        refresh does not leave a second schedule running alongside it."""
+        if self._refresh_after_id:
+            try:
+                self.root.after_cancel(self._refresh_after_id)
+            except Exception:
+                pass
+        self._refresh_after_id = self.root.after(self.update_interval, self.manual_refresh)
 
     def update_processes_list(self):
         self.refreshing = True
-        processes = {}
-        now = time.time()
+        try:
+            self._refresh_processes()
+        finally:
+            # always re-arm, or one failed refresh would stop auto-refresh for good
+            self.refreshing = False
+            if not self._closing:
+                self._schedule_next_refresh()
 
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'exe']):
+    def _refresh_processes(self):
+        processes = defaultdict(_new_group)
+        now = time.time()
+        # hoist attribute lookups out of the per-process loop
+        name_cache = self._name_cache
+        last_net_io = self.last_net_io
+        io_denied = self._io_denied
+        psutil_NoSuchProcess = psutil.NoSuchProcess
+        psutil_AccessDenied = psutil.AccessDenied
+        seen_pids = set()
+
+        estimate_power_mw = self._estimate_power_mw
+        bytes_to_mb = 1.0 / (1024 * 1024)
+
+        # Request every field in one pass so psutil reads each process once;
+        # io_counters is read separately below, only for processes that may have done I/O
+        for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cpu_percent']):
             try:
                 info = proc.info
                 pid = info.get('pid')
-                raw_name = (info.get('name') or "unknown").strip()
-                name_lower = raw_name.lower()
+                raw_name = info.get('name')
+                seen_pids.add(pid)
 
-                if name_lower.endswith(".exe"):
-                    key = name_lower
-                    display_name = raw_name
+                # names rarely change, so reuse the key computed on an earlier refresh
+                cached = name_cache.get(pid)
+                if cached and cached[2] == raw_name:
+                    key, display_name = cached[0], cached[1]
                 else:
-                    key = f"{name_lower}_{pid}"
-                    display_name = raw_name
+                    display_name = (raw_name or "unknown").strip()
+                    name_lower = display_name.lower()
+                    if name_lower.endswith(".exe"):
+                        key = name_lower
+                    else:
+                        key = f"{name_lower}_{pid}"
+                    name_cache[pid] = (key, display_name, raw_name)
 
-                cpu = proc.cpu_percent(interval=None)
-                mem_mb = 0.0
                 meminfo = info.get('memory_info')
-                if meminfo:
-                    mem_mb = (meminfo.rss or 0) / (1024.0 * 1024.0)
-
-                net_kbps = self._get_network_kbps_for_pid(pid, proc, now)
-                power_mw = self._estimate_power_mw(cpu)
-
-                if key not in processes:
-                    processes[key] = {
-                        "key": key,
-                        "display_name": display_name,
-                        "pids": [],
-                        "cpu": 0.0,
-                        "memory": 0.0,
-                        "power": 0.0,
-                        "network": 0.0,
-                        "per_pid": {}
-                    }
+                cpu = info.get('cpu_percent') or 0.0
+
+                # A process with no CPU time since the last sample cannot have issued
+                # I/O, so skip the syscall; it reports 0 KB/s and keeps its last reading.
+                # Pids whose counters were denied once (other users' services) are not retried.
+                io = None
+                if pid not in io_denied and (cpu > NET_SAMPLE_MIN_CPU or pid not in last_net_io):
+                    try:
+                        io = proc.io_counters()
+                    except psutil_AccessDenied:
+                        io_denied.add(pid)
+                    except Exception:
+                        io = None
+
+                # pids without a fresh reading keep their previous one, so the
+                # next delta spans the gap; first sightings count as no traffic
+                net_kbps = 0.0
+                if io:
+                    total = (io.read_bytes or 0) + (io.write_bytes or 0)
+                    prev = last_net_io.get(pid)
+                    if prev is not None:
+                        dt = max(now - prev[1], 0.001)
+                        net_kbps = max((total - prev[0]) / dt / 1024.0, 0.0)
+                    last_net_io[pid] = (total, now)
+
+                mem_mb = (meminfo.rss or 0) * bytes_to_mb if meminfo else 0.0
+                power_mw = estimate_power_mw(cpu)
 
                 agg = processes[key]
+                if not agg["pids"]:
+                    agg["key"] = key
+                    agg["display_name"] = display_name
                 agg["pids"].append(pid)
-                agg["cpu"] += float(cpu or 0.0)
-                agg["memory"] += float(mem_mb or 0.0)
-                agg["power"] += float(power_mw or 0.0)
-                agg["network"] += float(net_kbps or 0.0)
-                agg["per_pid"][pid] = {
-                    "cpu": float(cpu or 0.0),
-                    "memory": float(mem_mb or 0.0),
-                    "power": float(power_mw or 0.0),
-                    "network": float(net_kbps or 0.0)
-                }
-
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                agg["cpu"] += cpu
+                agg["memory"] += mem_mb
+                agg["power"] += power_mw
+                agg["network"] += net_kbps
+                agg["per_pid_cpu"].append(cpu)
+                agg["per_pid_memory"].append(mem_mb)
+                agg["per_pid_power"].append(power_mw)
+                agg["per_pid_network"].append(net_kbps)
+
+            except (psutil_NoSuchProcess, psutil_AccessDenied):
                 continue
             except Exception:
                 continue
 
+        # precompute the strings search_process matches against
+        for agg in processes.values():
+            agg["display_name_lc"] = agg["display_name"].lower()
+            agg["pid_strs"] = tuple(str(x) for x in agg["pids"])
+
+        # forget pids that have exited
+        for pid in [p for p in name_cache if p not in seen_pids]:
+            del name_cache[pid]
+        for pid in [p for p in last_net_io if p not in seen_pids]:
+            del last_net_io[pid]
+        io_denied &= seen_pids
+
         aggregated_list = list(processes.values())
         aggregated_list.sort(key=lambda x: x["cpu"], reverse=True)
         self.all_processes = aggregated_list
 
         # update UI
-        self.root.after(0, lambda: self.display_processes(self.all_processes))
-        # schedule next auto refresh
-        self.root.after(self.update_interval, self.manual_refresh)
-        self.refreshing = False
+        if not self._closing:
+            self.root.after_idle(self.display_processes, aggregated_list)
+        # back off while the process table is quiet, snap back when it churns
+        # per-process CPU sums to 100 x cores; scale to 0-100 so the thresholds
+        # mean the same as for the graph's system-wide figure
+        cpu_total = sum(p["cpu"] for p in aggregated_list) / self._cpu_count
+        if self._last_cpu_total is not None:
+            self.update_interval = self._adapt_interval(
+                self.update_interval, abs(cpu_total - self._last_cpu_total),
+                self._refresh_min, self._refresh_max
+            )
+        self._last_cpu_total = cpu_total
 
     # ---------------- Display & Notifications ----------------
     def display_processes(self, processes):
-        self.tree.delete(*self.tree.get_children())
-
+        """Start an incremental render of `processes` into the tree.
+        Rows are updated in place in chunks of DISPLAY_CHUNK_SIZE, each chunk
+        run from an idle callback so Tk can service input in between."""
         try:
             memory_limit = float(self.memory_limit_entry.get())
             if memory_limit < 0:
@@ -401,75 +588,233 @@ class TaskManagerApp:
         except Exception:
             memory_limit = 0.0
 
-        current_high_names = set()
-
-        for p in processes:
-            name = p["display_name"]
-            pid_list = p["pids"]
-            pid_display = f"{len(pid_list)} PIDs"
-            cpu_sum = p["cpu"]
-            mem_sum = p["memory"]
-            power_sum = p["power"]
-            net_sum = p["network"]
-
-            tag = ""
-            if memory_limit > 0 and mem_sum > memory_limit:
-                tag = "high_memory"
-                current_high_names.add(name)
-
-                with self.notification_lock:
-                    if name not in self.alerted_names:
-                        self.alerted_names.add(name)
-                        try:
-                            self.notifier.show_toast(
-                                "High Memory Usage",
-                                f"{name} is using {mem_sum:.2f} MB (limit {memory_limit:.0f} MB). Click to focus.",
-                                icon_path=None,
-                                duration=8,
-                                threaded=True,
-                                callback_on_click=lambda n=name: self.on_notification_click(n)
-                            )
-                        except Exception:
-                            # fallback: non-clickable toast
-                            try:
-                                self.notifier.show_toast(
-                                    "High Memory Usage",
-                                    f"{name} is using {mem_sum:.2f} MB (limit {memory_limit:.0f} MB).",
-                                    duration=8,
-                                    threaded=True
-                                )
-                            except Exception:
-                                pass
-
-            parent = self.tree.insert(
-                "", tk.END,
-                text=name,
-                values=(pid_display, f"{cpu_sum:.1f}", f"{mem_sum:.2f}", f"{power_sum:.0f}", f"{net_sum:.1f}"),
-                tags=(tag,),
-                open=False
+        try:
+            max_rows = int(self.max_rows_entry.get())
+        except Exception:
+            max_rows = DEFAULT_MAX_ROWS
+
+        # only the top `max_rows` groups (processes arrive sorted by CPU) get their
+        # own row; everything below is summed into a single "Other" row
+        processes = list(processes)
+        tail = []
+        if 0 < max_rows < len(processes):
+            processes, tail = processes[:max_rows], processes[max_rows:]
+            processes.append(self._other_group(tail))
+
+        # a newer render supersedes any chunks still pending from an older one
+        self._display_generation += 1
+        state = {
+            "generation": self._display_generation,
+            "memory_limit": memory_limit,
+            "high_names": set(),
+            "seen_keys": set(),
+            "seen_children": set(),
+            "tail": tail,
+            "new_alerts": [],  # (name, memory MB) of groups that newly crossed the limit
+        }
+        self._display_chunk_continue(processes, 0, state)
+
+    def _other_group(self, tail):
+        """Fold the groups in `tail` into one aggregate row without per-PID children."""
+        other = _new_group()
+        other["key"] = OTHER_GROUP_KEY
+        other["display_name"] = f"Other ({len(tail)} groups)"
+        other["is_other"] = True
+        for p in tail:
+            other["pids"].extend(p["pids"])
+            other["cpu"] += p["cpu"]
+            other["memory"] += p["memory"]
+            other["power"] += p["power"]
+            other["network"] += p["network"]
+        return other
+
+    def _display_chunk_continue(self, processes, start, state):
+        if state["generation"] != self._display_generation:
+            return
+
+        end = min(start + DISPLAY_CHUNK_SIZE, len(processes))
+        for index in range(start, end):
+            self._display_group(processes[index], index, state)
+
+        if end < len(processes):
+            self.root.after_idle(self._display_chunk_continue, processes, end, state)
+        else:
+            self._display_finish(state)
+
+    def _display_group(self, p, index, state):
+        """Insert or update one group row and its per-PID children."""
+        name = p["display_name"]
+        pid_list = p["pids"]
+        pid_display = f"{len(pid_list)} PIDs"
+        cpu_sum = p["cpu"]
+        mem_sum = p["memory"]
+        power_sum = p["power"]
+        net_sum = p["network"]
+
+        # the "Other" row stands for many unrelated groups: no alert, no children,
+        # and no pids for Stop/End Task to act on
+        is_other = p["is_other"]
+        child_pids = [] if is_other else pid_list
+
+        tag = "" if is_other else self._check_memory_alert(p, state)
+
+        parent = self._upsert_group_row(
+            p["key"], index, name,
+            (pid_display, f"{cpu_sum:.1f}", f"{mem_sum:.2f}", f"{power_sum:.0f}", f"{net_sum:.1f}"),
+            (tag,),
+            child_pids
+        )
+        # the "Other" label changes with its group count, and toasts never target it
+        if not is_other:
+            self._name_to_iid[name.lower()] = parent
+        state["seen_keys"].add(p["key"])
+
+        for pid, cpu_p, mem_p, power_p, net_p in zip(
+            child_pids, p["per_pid_cpu"], p["per_pid_memory"], p["per_pid_power"], p["per_pid_network"]
+        ):
+            self._upsert_pid_row(
+                p["key"], pid, parent,
+                (str(pid), f"{cpu_p:.1f}", f"{mem_p:.2f}", f"{power_p:.0f}", f"{net_p:.1f}")
             )
+            state["seen_children"].add((p["key"], pid))
 
-            for pid in pid_list:
-                d = p["per_pid"].get(pid, {})
-                cpu_p = d.get("cpu", 0.0)
-                mem_p = d.get("memory", 0.0)
-                power_p = d.get("power", 0.0)
-                net_p = d.get("network", 0.0)
-                self.tree.insert(
-                    parent, tk.END,
-                    text=f"PID {pid}",
-                    values=(str(pid), f"{cpu_p:.1f}", f"{mem_p:.2f}", f"{power_p:.0f}", f"{net_p:.1f}")
-                )
+    def _check_memory_alert(self, p, state):
+        """Queue a one-time alert when a group's memory exceeds the limit; returns the row tag."""
+        memory_limit = state["memory_limit"]
+        name = p["display_name"]
+        mem_sum = p["memory"]
+
+        tag = ""
+        if memory_limit > 0 and mem_sum > memory_limit:
+            tag = "high_memory"
+            state["high_names"].add(name)
+
+            with self.notification_lock:
+                if name not in self.alerted_names:
+                    # toasts are coalesced into one per render in _display_finish, which
+                    # also marks the names alerted (so a superseded render loses nothing)
+                    state["new_alerts"].append((name, mem_sum))
+
+        return tag
+
+    def _display_finish(self, state):
+        # groups folded into "Other" have no row but still get memory alerts
+        for p in state["tail"]:
+            self._check_memory_alert(p, state)
+
+        # drop rows that are no longer present
+        self._prune_rows(state["seen_keys"], state["seen_children"])
+
+        new_alerts = []
+        with self.notification_lock:
+            for name, mem_sum in state["new_alerts"]:
+                if name not in self.alerted_names:
+                    self.alerted_names.add(name)
+                    new_alerts.append((name, mem_sum))
+        if new_alerts:
+            self._show_memory_toast(new_alerts, state["memory_limit"])
 
         # cleanup alerted names no longer high
         with self.notification_lock:
-            to_remove = [n for n in self.alerted_names if n not in current_high_names]
+            to_remove = [n for n in self.alerted_names if n not in state["high_names"]]
             for n in to_remove:
                 try:
                     self.alerted_names.remove(n)
                 except Exception:
                     pass
 
+    def _show_memory_toast(self, alerts, memory_limit):
+        """Show a single toast covering every group that newly crossed the limit."""
+        first_name, first_mem = alerts[0]
+        if len(alerts) == 1:
+            message = f"{first_name} is using {first_mem:.2f} MB (limit {memory_limit:.0f} MB)."
+        else:
+            names = ", ".join(name for name, _ in alerts)
+            message = f"{len(alerts)} apps exceed {memory_limit:.0f} MB: {names}."
+
+        try:
+            notifier = self._get_notifier()
+            try:
+                notifier.show_toast(
+                    "High Memory Usage",
+                    message + " Click to focus.",
+                    icon_path=None,
+                    duration=8,
+                    threaded=True,
+                    callback_on_click=lambda n=first_name: self.on_notification_click(n)
+                )
+            except Exception:
+                # fallback: non-clickable toast
+                notifier.show_toast(
+                    "High Memory Usage",
+                    message,
+                    duration=8,
+                    threaded=True
+                )
+        except Exception:
+            pass
+
+    def _get_notifier(self):
+        """Create the ToastNotifier on first use rather than at startup."""
+        if self.notifier is None:
+            self.notifier = ToastNotifier()
+        return self.notifier
+
+    def _upsert_group_row(self, key, index, name, values, tags, pid_list):
+        """Update the parent row for `key` in place, or insert it if new.
+        Tk is only called when the row's content or position actually changed."""
+        order = self._top_order
+        row = (name, values, tags)
+        iid = self._row_index.get(key)
+        if iid is not None:
+            if self._row_cache.get(iid) != row:
+                self.tree.item(iid, text=name, values=values, tags=tags)
+                self._row_cache[iid] = row
+            if index >= len(order) or order[index] != iid:
+                self.tree.move(iid, "", index)
+                # mirror Tk: the row is taken out, then reinserted at `index`
+                order.remove(iid)
+                order.insert(index, iid)
+        else:
+            iid = self.tree.insert("", index, text=name, values=values, tags=tags, open=False)
+            self._row_index[key] = iid
+            self._row_cache[iid] = row
+            order.insert(index, iid)
+        self._pids_by_iid[iid] = pid_list
+        return iid
+
+    def _upsert_pid_row(self, key, pid, parent, values):
+        """Update the child row for (`key`, `pid`) in place, or insert it if new."""
+        iid = self._child_index.get((key, pid))
+        if iid is not None:
+            if self._row_cache.get(iid) != values:
+                self.tree.item(iid, values=values)
+                self._row_cache[iid] = values
+        else:
+            iid = self.tree.insert(parent, tk.END, text=f"PID {pid}", values=values)
+            self._child_index[(key, pid)] = iid
+            self._row_cache[iid] = values
+        return iid
+
+    def _prune_rows(self, seen_keys, seen_children):
+        """Delete parent and child rows whose keys were not seen in the last display."""
+        for child_key in [k for k in self._child_index if k not in seen_children]:
+            iid = self._child_index.pop(child_key)
+            self._row_cache.pop(iid, None)
+            if self.tree.exists(iid):
+                self.tree.delete(iid)
+        removed = set()
+        for key in [k for k in self._row_index if k not in seen_keys]:
+            iid = self._row_index.pop(key)
+            removed.add(iid)
+            self._pids_by_iid.pop(iid, None)
+            self._row_cache.pop(iid, None)
+            if self.tree.exists(iid):
+                self.tree.delete(iid)
+        if removed:
+            self._name_to_iid = {n: i for n, i in self._name_to_iid.items() if i not in removed}
+            self._top_order[:] = [i for i in self._top_order if i not in removed]
+
     def on_notification_click(self, process_name):
         """Called when user clicks the toast: focus window and select parent row."""
         def _focus_and_select():
@@ -477,14 +822,13 @@ class TaskManagerApp:
                 self.root.deiconify()
                 self.root.lift()
                 self.root.focus_force()
-                for child in self.tree.get_children():
-                    if str(self.tree.item(child, "text")).lower() == str(process_name).lower():
-                        self.tree.selection_set(child)
-                        self.tree.focus(child)
-                        self.tree.see(child)
-                        # also expand to show PIDs
-                        self.tree.item(child, open=True)
-                        break
+                iid = self._name_to_iid.get(str(process_name).lower())
+                if iid is not None:
+                    self.tree.selection_set(iid)
+                    self.tree.focus(iid)
+                    self.tree.see(iid)
+                    # also expand to show PIDs
+                    self.tree.item(iid, open=True)
             except Exception:
                 pass
 
@@ -500,14 +844,10 @@ class TaskManagerApp:
             self.display_processes(self.all_processes)
             return
 
-        filtered = []
-        for p in self.all_processes:
-            name = p["display_name"]
-            if query in name.lower():
-                filtered.append(p)
-                continue
-            if any(query in str(pid) for pid in p["pids"]):
-                filtered.append(p)
+        filtered = [
+            p for p in self.all_processes
+            if query in p["display_name_lc"] or any(query in pid for pid in p["pid_strs"])
+        ]
 
         if not filtered:
             messagebox.showinfo("Not Found", f"No match for: {query}")
@@ -522,18 +862,7 @@ class TaskManagerApp:
 
         parent = selected if not self.tree.parent(selected) else self.tree.parent(selected)
 
-        pid_list = []
-        for child in self.tree.get_children(parent):
-            pid_val = str(self.tree.set(child, "pids") or "")
-            if pid_val.isdigit():
-                pid_list.append(int(pid_val))
-            else:
-                text = str(self.tree.item(child, "text") or "")
-                if text.lower().startswith("pid"):
-                    try:
-                        pid_list.append(int(text.split()[1]))
-                    except Exception:
-                        pass
+        pid_list = self._pids_by_iid.get(parent, [])
 
         if not pid_list:
             messagebox.showwarning("Warning", "Could not determine PIDs to terminate.")
@@ -586,36 +915,44 @@ class TaskManagerApp:
             info_lines = [f"{pid_text}", f"Values: {vals}"]
             try:
                 pid_num = int(pid_text.split()[1])
-                try:
-                    p = psutil.Process(pid_num)
-                    try:
-                        exe = p.exe()
-                    except Exception:
-                        exe = "N/A"
-                    try:
-                        status = p.status()
-                    except Exception:
-                        status = "N/A"
-                    try:
-                        threads = p.num_threads()
-                    except Exception:
-                        threads = "N/A"
-                    try:
-                        cpu_pct = p.cpu_percent(interval=0.1)
-                    except Exception:
-                        cpu_pct = "N/A"
-                    try:
-                        mem_mb = p.memory_info().rss / (1024 * 1024)
-                    except Exception:
-                        mem_mb = "N/A"
+            except Exception:
+                messagebox.showinfo("PID Info", "\n".join(info_lines))
+                return
+            # the CPU sample blocks for 100 ms, so gather details off the Tk thread
+            threading.Thread(target=self._collect_pid_details, args=(pid_num, info_lines), daemon=True).start()
 
-                    info_lines.append(f"exe={exe}, status={status}, threads={threads}, cpu={cpu_pct}, mem={mem_mb}")
-                except psutil.NoSuchProcess:
-                    info_lines.append("(process no longer exists)")
+    def _collect_pid_details(self, pid_num, info_lines):
+        """Worker thread: append psutil details for pid_num, then show them on the Tk thread."""
+        try:
+            p = psutil.Process(pid_num)
+            try:
+                exe = p.exe()
             except Exception:
-                pass
+                exe = "N/A"
+            try:
+                status = p.status()
+            except Exception:
+                status = "N/A"
+            try:
+                threads = p.num_threads()
+            except Exception:
+                threads = "N/A"
+            try:
+                cpu_pct = p.cpu_percent(interval=0.1)
+            except Exception:
+                cpu_pct = "N/A"
+            try:
+                mem_mb = p.memory_info().rss / (1024 * 1024)
+            except Exception:
+                mem_mb = "N/A"
 
-            messagebox.showinfo("PID Info", "\n".join(info_lines))
+            info_lines.append(f"exe={exe}, status={status}, threads={threads}, cpu={cpu_pct}, mem={mem_mb}")
+        except psutil.NoSuchProcess:
+            info_lines.append("(process no longer exists)")
+        except Exception:
+            pass
+
+        self.root.after(0, lambda: messagebox.showinfo("PID Info", "\n".join(info_lines)))
 
     # ---------------- Graph updates ----------------
     def update_graph(self):
@@ -623,20 +960,44 @@ class TaskManagerApp:
             cpu = psutil.cpu_percent(interval=None)
             mem = psutil.virtual_memory().percent
 
+            if self._last_graph_sample is not None:
+                last_cpu, last_mem = self._last_graph_sample
+                self._graph_interval_ms = self._adapt_interval(
+                    self._graph_interval_ms, abs(cpu - last_cpu) + abs(mem - last_mem),
+                    self._graph_min, self._graph_max
+                )
+            self._last_graph_sample = (cpu, mem)
+
             self.cpu_data.append(cpu)
             self.mem_data.append(mem)
-            if len(self.cpu_data) > 60:
-                self.cpu_data.pop(0)
-                self.mem_data.pop(0)
-
-            self.line_cpu.set_data(range(len(self.cpu_data)), self.cpu_data)
-            self.line_mem.set_data(range(len(self.mem_data)), self.mem_data)
-            self.ax.set_xlim(0, max(10, len(self.cpu_data)))
-            self.canvas.draw_idle()
+
+            self.line_cpu.set_data(range(len(self.cpu_data)), list(self.cpu_data))
+            self.line_mem.set_data(range(len(self.mem_data)), list(self.mem_data))
+
+            xmax = max(10, len(self.cpu_data))
+            if xmax != self._graph_xmax or self._graph_bg is None:
+                # axis changed: full redraw, which recaptures the background via draw_event
+                self._graph_xmax = xmax
+                self.ax.set_xlim(0, xmax)
+                self.canvas.draw()
+            else:
+                self.canvas.restore_region(self._graph_bg)
+                self._blit_graph_lines()
         except Exception:
             pass
         finally:
-            self.root.after(1000, self.update_graph)
+            self.root.after(self._graph_interval_ms, self.update_graph)
+
+    def _on_graph_draw(self, event):
+        self._graph_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._blit_graph_lines()
+
+    def _blit_graph_lines(self):
+        self.ax.draw_artist(self.line_cpu)
+        self.ax.draw_artist(self.line_mem)
+        # keep the legend on top of the lines
+        self.ax.draw_artist(self.legend)
+        self.canvas.blit(self.ax.bbox)
 
     # ---------------- Persisted-suspension handling on startup ----------------
     def check_persisted_suspend_state(self):
@@ -674,35 +1035,15 @@ class TaskManagerApp:
                     if resumed > 0:
                         messagebox.showinfo("Resumed", f"{resumed} process(es) resumed.")
                 else:
-                    # schedule a background thread to auto-resume when time arrives
-                    threading.Thread(target=self._delayed_resume_from_persisted, args=(pids, resume_time), daemon=True).start()
+                    # schedule auto-resume on the event loop when time arrives
+                    self._schedule_resume(self._procs_for_pids(pids), resume_time, PERSISTED_RESUME_MESSAGE)
             except Exception:
                 # if messagebox fails, still schedule auto-resume
-                threading.Thread(target=self._delayed_resume_from_persisted, args=(pids, resume_time), daemon=True).start()
+                self._schedule_resume(self._procs_for_pids(pids), resume_time, PERSISTED_RESUME_MESSAGE)
 
         # show popup on main thread
         self.root.after(0, ask_and_take_action)
 
-    def _delayed_resume_from_persisted(self, pids, resume_time):
-        """Background thread: wait until resume_time then resume persisted pids and clear file."""
-        now = time.time()
-        wait = resume_time - now
-        if wait > 0:
-            time.sleep(wait)
-        resumed = 0
-        for pid in pids:
-            try:
-                psutil.Process(int(pid)).resume()
-                resumed += 1
-            except Exception:
-                pass
-        try:
-            self.clear_suspend_state()
-        except Exception:
-            pass
-        if resumed > 0:
-            self.root.after(0, lambda: messagebox.showinfo("Resumed", f"{resumed} process(es) resumed (persisted session)."))
-
 # ---------------- Run ----------------
 if __name__ == "__main__":
     root = tk.Tk()